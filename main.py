@@ -8,13 +8,16 @@ Author: Anubhav
 Version: 1.0.0
 """
 
+import asyncio
+import secrets
 import sqlite3
-from contextlib import contextmanager
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
 from fastapi_mcp import FastApiMCP
 
 # Initialize FastAPI application with metadata for API documentation
@@ -24,37 +27,212 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Database configuration
 DATABASE_FILE = "todos.db"
+READ_POOL_SIZE = 8  # Read-only connections, so concurrent list streams don't share one
+STREAM_BATCH_SIZE = 500  # Rows fetched and sent per chunk when streaming lists
+
+# SQL statements used by the endpoints. Keeping the text fixed lets each pooled
+# connection's statement cache reuse the prepared statement across requests.
+# List queries have SQLite encode each row as a JSON object, turning the stored
+# 0/1 into true/false, so no per-row conversion or encoding happens in Python
+TODO_JSON = (
+    "json_object('todo_id', todo_id, 'content', content, "
+    "'completed', json(CASE WHEN completed THEN 'true' ELSE 'false' END))"
+)
+SQL_GET_ALL = f"SELECT {TODO_JSON} FROM todos ORDER BY todo_id"
+# Served by idx_todos_completed, which matches both the filter and the ordering
+SQL_GET_BY_STATUS = f"SELECT {TODO_JSON} FROM todos WHERE completed = ? ORDER BY todo_id"
+SQL_GET_ONE = "SELECT * FROM todos WHERE todo_id = ?"
+# Formatted with one "?" placeholder per requested ID
+SQL_GET_MANY = f"SELECT {TODO_JSON} FROM todos WHERE todo_id IN ({{}}) ORDER BY todo_id"
+SQL_DELETE = "DELETE FROM todos WHERE todo_id = ?"
+# Newest rows first; used to read back the rows of a bulk insert
+SQL_GET_LATEST = "SELECT * FROM todos ORDER BY todo_id DESC LIMIT ?"
+# Writes return the affected row directly (SQLite 3.35+), saving a follow-up SELECT
+SQL_INSERT = (
+    "INSERT INTO todos (content, completed) VALUES (?, ?) "
+    "RETURNING todo_id, content, completed"
+)
+# executemany rejects statements that return rows, so bulk inserts go without RETURNING
+SQL_INSERT_MANY = "INSERT INTO todos (content, completed) VALUES (?, ?)"
+SQL_UPDATE_CONTENT = (
+    "UPDATE todos SET content = ? WHERE todo_id = ? "
+    "RETURNING todo_id, content, completed"
+)
+SQL_UPDATE_COMPLETED = (
+    "UPDATE todos SET completed = ? WHERE todo_id = ? "
+    "RETURNING todo_id, content, completed"
+)
+SQL_UPDATE_BOTH = (
+    "UPDATE todos SET content = ?, completed = ? WHERE todo_id = ? "
+    "RETURNING todo_id, content, completed"
+)
+
+# Statement for a partial update keyed by (content provided, completed provided).
+# An update with no fields is served by load_todo instead, without a write.
+SQL_UPDATE = {
+    (True, False): SQL_UPDATE_CONTENT,
+    (False, True): SQL_UPDATE_COMPLETED,
+    (True, True): SQL_UPDATE_BOTH,
+}
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# All SQLite work runs on this single thread: writers are serialized by SQLite
+# anyway, and one dedicated worker avoids hopping between pool threads. Each
+# connection is created and used only on this thread.
+db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+
+
+async def run_db(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking database function on the database thread.
+
+    Args:
+        func: Function performing the SQLite work
+        *args: Arguments passed to func
+
+    Returns:
+        The value returned by func
+    """
+    return await asyncio.get_running_loop().run_in_executor(db_executor, func, *args)
+
+
+def open_connection(readonly: bool = False) -> sqlite3.Connection:
+    """
+    Open a SQLite connection configured for reuse across requests.
+    Autocommit mode is used so transactions are controlled explicitly.
+    Must be called on the database thread.
+
+    Args:
+        readonly: Open the database in read-only mode
+    """
+    if readonly:
+        conn = sqlite3.connect(
+            f"file:{DATABASE_FILE}?mode=ro", uri=True, isolation_level=None
+        )
+    else:
+        conn = sqlite3.connect(DATABASE_FILE, isolation_level=None)
+        conn.execute("PRAGMA synchronous=NORMAL")
+    # No row_factory: rows stay plain tuples, which are cheaper to build and
+    # index than sqlite3.Row; every query reads columns by position
+    # Per-connection tuning; journal_mode=WAL is persisted by init_database
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
+
+# Long-lived connections so each request reuses an open connection (and its
+# page cache) instead of paying for a fresh connect/close. Opened on startup.
+# A single write connection suffices, since every write transaction runs to
+# completion as one job on the database thread.
+write_conn: Optional[sqlite3.Connection] = None
+read_pool: "asyncio.Queue[sqlite3.Connection]" = asyncio.Queue(
+    maxsize=READ_POOL_SIZE
+)
+
+
+def write_transaction(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run func(conn, *args) on the write connection inside one transaction.
+    Must be called on the database thread; see run_write.
+
+    Args:
+        func: Function performing the writes
+        *args: Arguments passed to func after the connection
+
+    Returns:
+        The value returned by func
+    """
+    conn = write_conn
+    try:
+        conn.execute("BEGIN")
+        result = func(conn, *args)
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    return result
+
+
+async def run_write(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run func(conn, *args) in a write transaction on the database thread.
+    The transaction runs to completion even if the awaiting request is
+    cancelled, so writes that affect the cache go through run_cached_write.
+    """
+    return await run_db(write_transaction, func, *args)
 
 
 # Database connection context manager for proper resource management
-@contextmanager
-def get_db_connection():
+@asynccontextmanager
+async def get_db_readonly():
     """
-    Context manager for SQLite database connections.
-    Ensures proper connection handling and automatic cleanup.
+    Async context manager for pooled read-only SQLite connections.
+    No transaction is opened, so reads skip the BEGIN/COMMIT round-trips;
+    each statement still sees a consistent snapshot.
     """
-    conn = sqlite3.connect(DATABASE_FILE)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    conn = await read_pool.get()
     try:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
     finally:
-        conn.close()
+        read_pool.put_nowait(conn)
+
+
+def fetch_one(
+    conn: sqlite3.Connection, query: str, params: tuple = ()
+) -> Optional[tuple]:
+    """Execute a statement and return its first row. Database thread only."""
+    return conn.execute(query, params).fetchone()
+
+
+def fetch_all(
+    conn: sqlite3.Connection, query: str, params: tuple = ()
+) -> List[tuple]:
+    """Execute a statement and return all its rows. Database thread only."""
+    return conn.execute(query, params).fetchall()
+
+
+def insert_many(
+    conn: sqlite3.Connection, values: List[tuple]
+) -> List[tuple]:
+    """
+    Insert several todos and return the created rows in ID order.
+    Database thread only.
+    """
+    conn.executemany(SQL_INSERT_MANY, values)
+    # AUTOINCREMENT IDs only grow and this transaction holds the write lock,
+    # so the newest rows are the ones just inserted
+    rows = conn.execute(SQL_GET_LATEST, (len(values),)).fetchall()
+    rows.reverse()
+    return rows
+
+
+def delete_row(conn: sqlite3.Connection, todo_id: int) -> int:
+    """Delete a todo and return the number of rows removed. Database thread only."""
+    return conn.execute(SQL_DELETE, (todo_id,)).rowcount
 
 
 def init_database() -> None:
     """
     Initialize the database by creating the todos table if it doesn't exist.
     Called on application startup to ensure the database schema is ready.
+
+    Also switches the database file to WAL mode, which is persistent and lets
+    readers proceed concurrently with a writer.
     """
-    with get_db_connection() as conn:
+    conn = sqlite3.connect(DATABASE_FILE)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS todos (
@@ -64,6 +242,15 @@ def init_database() -> None:
             )
             """
         )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_todos_completed
+            ON todos (completed, todo_id)
+            """
+        )
+        conn.commit()
+    finally:
+        conn.close()
 
 
 # Pydantic models for request/response validation and API documentation
@@ -114,34 +301,203 @@ class Todo(BaseModel):
         from_attributes = True
 
 
+# Compiled serializer that encodes a whole list of todos to JSON in one pass
+todos_adapter = TypeAdapter(List[Todo])
+
+
 # Helper function to convert database row to Todo model
-def row_to_todo(row: sqlite3.Row) -> Todo:
+def row_to_todo(row: tuple) -> Todo:
     """
-    Convert a SQLite Row object to a Todo Pydantic model.
+    Convert a database row to a Todo Pydantic model.
+
+    Rows come straight from the todos table, whose schema already guarantees
+    the field types, so validation is skipped via model_construct.
     
     Args:
-        row: SQLite Row object from database query
+        row: Row tuple from a database query (todo_id, content, completed)
         
     Returns:
         Todo: Pydantic model instance
     """
-    return Todo(
-        todo_id=row["todo_id"],
-        content=row["content"],
-        completed=bool(row["completed"]),
+    return Todo.model_construct(
+        todo_id=row[0],
+        content=row[1],
+        completed=bool(row[2]),
     )
 
 
+# In-process cache for GET /todos/{todo_id}, kept up to date by every write.
+# Writes hold the lock for their whole transaction, so cache updates are
+# applied in commit order. Reads fill the cache without the lock and only
+# store a result if no write committed meanwhile (see load_todo).
+todo_cache: Dict[int, Dict[str, Any]] = {}
+cache_lock = asyncio.Lock()
+
+# Version of the data, bumped on every committed write and used to build ETags.
+# The random prefix keeps tags from a previous process (or another worker)
+# from matching once the counter restarts.
+data_version = 0
+ETAG_PREFIX = secrets.token_hex(4)
+
+
+def update_cache(todo_id: int, todo: Optional[Todo] = None) -> None:
+    """
+    Apply a committed write to the cache and bump the data version.
+    Must be called with cache_lock held.
+
+    Args:
+        todo_id: ID of the modified todo item
+        todo: The todo row returned by the write, or None if it was deleted
+    """
+    global data_version
+    data_version += 1
+    if todo is None:
+        todo_cache.pop(todo_id, None)
+    else:
+        todo_cache[todo_id] = todo.model_dump()
+
+
+async def run_cached_write(
+    apply: Callable[[T], R], func: Callable[..., T], *args: Any
+) -> R:
+    """
+    Run a write transaction and apply its result to the cache as one unit.
+
+    Both steps run in their own shielded task, so a request cancelled after
+    submitting the write still gets the cache and data version updated once
+    the write commits.
+
+    Args:
+        apply: Called with func's result, with cache_lock held
+        func: Function performing the writes (see run_write)
+        *args: Arguments passed to func after the connection
+
+    Returns:
+        The value returned by apply
+    """
+
+    async def write_and_apply() -> R:
+        async with cache_lock:
+            return apply(await run_write(func, *args))
+
+    return await asyncio.shield(write_and_apply())
+
+
+def make_etag(resource: str) -> str:
+    """
+    Build a weak ETag for a resource at the current data version.
+
+    Args:
+        resource: Identifies the response, e.g. the todo ID or list filter
+
+    Returns:
+        str: Weak ETag header value
+    """
+    return f'W/"{ETAG_PREFIX}-{data_version}-{resource}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+    Uses weak comparison, as required for If-None-Match.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the requested resource
+
+    Returns:
+        bool: True if the client's copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
+
+async def load_todo(todo_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Look up a todo in the cache, falling back to a read-only query.
+
+    Args:
+        todo_id: The unique identifier of the todo item
+
+    Returns:
+        Optional[Dict[str, Any]]: The todo item, or None if it doesn't exist
+    """
+    todo = todo_cache.get(todo_id)
+    if todo is None:
+        # Not under cache_lock: waiting for a read connection (e.g. while list
+        # streams hold the pool) must never stall writers. If a write bumped
+        # the version during the read, the row may be stale and isn't cached;
+        # a write committing unnoticed is still applied by its update_cache.
+        version = data_version
+        async with get_db_readonly() as conn:
+            row = await run_db(fetch_one, conn, SQL_GET_ONE, (todo_id,))
+        if not row:
+            return None
+        todo = {"todo_id": row[0], "content": row[1], "completed": bool(row[2])}
+        if data_version == version:
+            todo_cache[todo_id] = todo
+    return todo
+
+
+async def stream_todos(query: str, params: tuple = ()) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of a todos query as a JSON array.
+    Rows are fetched in batches, so the full list never has to be held in memory.
+
+    Args:
+        query: SELECT statement returning one JSON object per row (see TODO_JSON)
+        params: Parameters bound to the query
+
+    Yields:
+        bytes: Consecutive fragments of the JSON array
+    """
+    async with get_db_readonly() as conn:
+        cursor = await run_db(conn.execute, query, params)
+        try:
+            yield b"["
+            separator = b""
+            while rows := await run_db(cursor.fetchmany, STREAM_BATCH_SIZE):
+                yield separator + ",".join([row[0] for row in rows]).encode()
+                separator = b","
+            yield b"]"
+        finally:
+            # Submitted rather than awaited so it also runs if the stream is
+            # cancelled; it is queued ahead of the connection's next use
+            db_executor.submit(cursor.close)
+
+
 # API Endpoints
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """
-    Initialize the database when the application starts.
+    Initialize the database and open the connections when the application starts.
     This ensures the todos table exists before handling any requests.
     """
-    init_database()
+    global write_conn
+    await run_db(init_database)
+    write_conn = await run_db(open_connection)
+    for _ in range(READ_POOL_SIZE):
+        read_pool.put_nowait(await run_db(open_connection, True))
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """
+    Close all database connections when the application stops.
+    """
+    while not read_pool.empty():
+        await run_db(read_pool.get_nowait().close)
+    await run_db(write_conn.close)
 
 
 @app.get("/", tags=["Root"], operation_id="read_root")
@@ -167,20 +523,76 @@ async def read_root() -> JSONResponse:
     status_code=status.HTTP_200_OK,
     tags=["Todos"],
     summary="Get all todos",
-    description="Retrieve a list of all todo items from the database",
+    description="Retrieve a list of all todo items from the database, optionally filtered by completion status",
     operation_id="get_all_todos",
 )
-async def get_all_todos() -> List[Todo]:
+async def get_all_todos(
+    request: Request,
+    completed: Optional[bool] = Query(
+        None, description="Only return todos with this completion status"
+    ),
+) -> Response:
     """
     Get all todo items from the database.
+
+    The list is streamed straight from the database cursor, so memory use
+    stays constant however many todos there are. Clients sending a matching
+    If-None-Match header get 304 Not Modified without touching the database.
+    
+    Args:
+        request: Incoming request, checked for If-None-Match
+        completed: Optional completion status to filter by
+        
+    Returns:
+        Response: JSON list of all (or all matching) todo items, or 304
+    """
+    etag = make_etag(f"all-{completed}")
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    if completed is None:
+        query, params = SQL_GET_ALL, ()
+    else:
+        query, params = SQL_GET_BY_STATUS, (completed,)
+    return StreamingResponse(
+        stream_todos(query, params),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+# Declared before /todos/{todo_id} so "batch" is not parsed as a todo ID
+@app.get(
+    "/todos/batch",
+    response_model=List[Todo],
+    status_code=status.HTTP_200_OK,
+    tags=["Todos"],
+    summary="Get several todos by ID",
+    description="Retrieve multiple todo items by their IDs in a single query",
+    operation_id="get_todos_batch",
+)
+async def get_todos_batch(
+    ids: List[int] = Query(..., description="IDs of the todo items to fetch"),
+) -> Response:
+    """
+    Get several todo items by ID with one database query.
+    Preferred over calling GET /todos/{todo_id} once per item.
     
+    Args:
+        ids: The unique identifiers of the todo items (repeat the parameter, e.g. ?ids=1&ids=2)
+        
     Returns:
-        List[Todo]: List of all todo items
+        Response: JSON list of the matching todo items ordered by ID; unknown IDs are skipped
     """
-    with get_db_connection() as conn:
-        cursor = conn.execute("SELECT * FROM todos ORDER BY todo_id")
-        rows = cursor.fetchall()
-        return [row_to_todo(row) for row in rows]
+    async with get_db_readonly() as conn:
+        rows = await run_db(
+            fetch_all, conn, SQL_GET_MANY.format(",".join("?" * len(ids))), ids
+        )
+    return Response(
+        f"[{','.join([row[0] for row in rows])}]", media_type="application/json"
+    )
 
 
 @app.get(
@@ -192,28 +604,35 @@ async def get_all_todos() -> List[Todo]:
     description="Retrieve a single todo item by its ID",
     operation_id="get_todo",
 )
-async def get_todo(todo_id: int) -> Todo:
+async def get_todo(request: Request, todo_id: int) -> Response:
     """
     Get a specific todo item by ID.
+    Clients sending a matching If-None-Match header get 304 Not Modified,
+    but only once the todo is known to exist (from the cache or the database).
     
     Args:
+        request: Incoming request, checked for If-None-Match
         todo_id: The unique identifier of the todo item
         
     Returns:
-        Todo: The todo item with the specified ID
+        Response: The todo item with the specified ID, or 304
         
     Raises:
         HTTPException: 404 if todo with given ID is not found
     """
-    with get_db_connection() as conn:
-        cursor = conn.execute("SELECT * FROM todos WHERE todo_id = ?", (todo_id,))
-        row = cursor.fetchone()
-        if not row:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Todo with id {todo_id} not found",
-            )
-        return row_to_todo(row)
+    # Built before the lookup, so the tag never claims a newer version than the data
+    etag = make_etag(str(todo_id))
+    todo = await load_todo(todo_id)
+    if todo is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Todo with id {todo_id} not found",
+        )
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return ORJSONResponse(todo, headers={"ETag": etag})
 
 
 @app.post(
@@ -235,16 +654,56 @@ async def create_todo(todo: TodoCreate) -> Todo:
     Returns:
         Todo: The newly created todo item with its generated ID
     """
-    with get_db_connection() as conn:
-        cursor = conn.execute(
-            "INSERT INTO todos (content, completed) VALUES (?, ?)",
-            (todo.content, todo.completed),
-        )
-        todo_id = cursor.lastrowid
-        # Fetch the newly created todo to return it
-        cursor = conn.execute("SELECT * FROM todos WHERE todo_id = ?", (todo_id,))
-        row = cursor.fetchone()
-        return row_to_todo(row)
+
+    def cache_created(row: tuple) -> Todo:
+        new_todo = row_to_todo(row)
+        update_cache(new_todo.todo_id, new_todo)
+        return new_todo
+
+    return await run_cached_write(
+        cache_created, fetch_one, SQL_INSERT, (todo.content, todo.completed)
+    )
+
+
+@app.post(
+    "/todos/bulk",
+    response_model=List[Todo],
+    status_code=status.HTTP_201_CREATED,
+    tags=["Todos"],
+    summary="Create several todos",
+    description="Create multiple todo items in a single database transaction",
+    operation_id="create_todos_bulk",
+)
+async def create_todos_bulk(todos: List[TodoCreate]) -> Response:
+    """
+    Create several todo items at once.
+    All rows are inserted with one executemany call and committed together.
+    The created list is serialized by todos_adapter in a single pass rather
+    than being re-validated item by item against the response model.
+    
+    Args:
+        todos: List of TodoCreate models with content and optional completed status
+        
+    Returns:
+        Response: JSON list of the newly created todo items with their generated IDs
+    """
+
+    def cache_created(rows: List[tuple]) -> List[Todo]:
+        new_todos = [row_to_todo(row) for row in rows]
+        for new_todo in new_todos:
+            update_cache(new_todo.todo_id, new_todo)
+        return new_todos
+
+    new_todos = await run_cached_write(
+        cache_created,
+        insert_many,
+        [(todo.content, todo.completed) for todo in todos],
+    )
+    return Response(
+        todos_adapter.dump_json(new_todos),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 
 @app.put(
@@ -270,34 +729,39 @@ async def update_todo(todo_id: int, todo_update: TodoUpdate) -> Todo:
     Raises:
         HTTPException: 404 if todo with given ID is not found
     """
-    with get_db_connection() as conn:
-        # Check if todo exists
-        cursor = conn.execute("SELECT * FROM todos WHERE todo_id = ?", (todo_id,))
-        if not cursor.fetchone():
+    key = (todo_update.content is not None, todo_update.completed is not None)
+    if key == (False, False):
+        # Nothing to change: read the todo back without a write or version bump
+        todo = await load_todo(todo_id)
+        if todo is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Todo with id {todo_id} not found",
             )
+        return Todo.model_construct(**todo)
 
-        # Build update query dynamically based on provided fields
-        updates = []
-        params = []
-        if todo_update.content is not None:
-            updates.append("content = ?")
-            params.append(todo_update.content)
-        if todo_update.completed is not None:
-            updates.append("completed = ?")
-            params.append(todo_update.completed)
-
-        if updates:
-            params.append(todo_id)
-            query = f"UPDATE todos SET {', '.join(updates)} WHERE todo_id = ?"
-            conn.execute(query, params)
-
-        # Fetch and return the updated todo
-        cursor = conn.execute("SELECT * FROM todos WHERE todo_id = ?", (todo_id,))
-        row = cursor.fetchone()
-        return row_to_todo(row)
+    def cache_updated(row: Optional[tuple]) -> Optional[Todo]:
+        if not row:
+            return None
+        updated_todo = row_to_todo(row)
+        # Cache the returned row so the next GET needn't look it up again
+        update_cache(todo_id, updated_todo)
+        return updated_todo
+
+    # Update and fetch in one statement; no row back means no such todo
+    query = SQL_UPDATE[key]
+    params = tuple(
+        value
+        for value in (todo_update.content, todo_update.completed, todo_id)
+        if value is not None
+    )
+    updated_todo = await run_cached_write(cache_updated, fetch_one, query, params)
+    if updated_todo is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Todo with id {todo_id} not found",
+        )
+    return updated_todo
 
 
 @app.delete(
@@ -318,14 +782,18 @@ async def delete_todo(todo_id: int) -> None:
     Raises:
         HTTPException: 404 if todo with given ID is not found
     """
-    with get_db_connection() as conn:
-        cursor = conn.execute("DELETE FROM todos WHERE todo_id = ?", (todo_id,))
-        if cursor.rowcount == 0:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Todo with id {todo_id} not found",
-            )
+
+    def cache_deleted(deleted: int) -> int:
+        if deleted:
+            update_cache(todo_id)
+        return deleted
+
+    if await run_cached_write(cache_deleted, delete_row, todo_id) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Todo with id {todo_id} not found",
+        )
 
 # MCP Server
-mcp = FastApiMCP(app, include_operations=["get_all_todos", "get_todo", "create_todo", "update_todo", "delete_todo"])
+mcp = FastApiMCP(app, include_operations=["get_all_todos", "get_todos_batch", "get_todo", "create_todo", "create_todos_bulk", "update_todo", "delete_todo"])
 mcp.mount()
\ No newline at end of file